@@ -10,11 +10,72 @@ Versione: 1.0
 
 import yaml
 import sys
+import os
+import shutil
+import tempfile
+import fnmatch
 import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, StringIO
+from contextlib import redirect_stdout
 import re
-from copy import deepcopy
+
+# ruamel.yaml è opzionale: serve solo per preservare i commenti
+try:
+    from ruamel.yaml import YAML as _RuamelYAML
+except ImportError:
+    _RuamelYAML = None
+
+# Usa i binding C di LibYAML quando disponibili (parsing molto più veloce)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+from yaml.composer import Composer, ComposerError
+
+class _StreamingLoader(SafeLoader, Composer):
+    """SafeLoader che espone compose_node anche con i binding C, per comporre
+    un nodo alla volta invece dell'intero documento"""
+    
+    def __init__(self, stream):
+        super().__init__(stream)
+        self.anchors = {}
+
+# Chiavi che identificano un'automazione e le due sintassi
+_AUTOMATION_KEYS = frozenset({'trigger', 'triggers', 'condition', 'conditions',
+                              'action', 'actions', 'alias'})
+_NEW_KEYS = frozenset({'triggers', 'conditions', 'actions'})
+_OLD_KEYS = frozenset({'trigger', 'condition', 'action'})
+_NO_KEYS = frozenset()
+# Estensioni dei file YAML considerati in modalità directory e relativo
+# suffisso del file convertito
+_NEW_SUFFIX = {'.yml': '.new.yml', '.yaml': '.new.yaml'}
+# Ordine di conversione delle chiavi (vecchia -> nuova)
+_RENAMES = (('trigger', 'triggers'), ('condition', 'conditions'), ('action', 'actions'))
+
+# Sentinella per pop() senza doppio lookup
+_MISSING = object()
+
+# Istanza ruamel.yaml condivisa, creata alla prima richiesta
+_RUAMEL_LOADER = None
+
+def _get_ruamel():
+    """Restituisce il loader ruamel.yaml configurato, creandolo una sola volta"""
+    global _RUAMEL_LOADER
+    if _RUAMEL_LOADER is None:
+        loader = _RuamelYAML()
+        loader.preserve_quotes = True
+        loader.width = 4096
+        _RUAMEL_LOADER = loader
+    return _RUAMEL_LOADER
+
+def _default_file_mode() -> int:
+    """Permessi di un nuovo file creato con open(), secondo la umask corrente"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
 
 class HAYamlConverter:
     """Convertitore per automazioni Home Assistant da vecchia a nuova sintassi"""
@@ -22,84 +83,92 @@ class HAYamlConverter:
     def __init__(self, preserve_comments=True):
         self.preserve_comments = preserve_comments
         self.changes_log = []
+        self._converted_count = 0
+        self._already_new_count = 0
         self.total_stats = {'converted': 0, 'already_new': 0, 'total': 0}
         
         # Configurazione YAML per preservare ordine e formattazione
         if preserve_comments:
-            from ruamel.yaml import YAML
-            self.yaml_loader = YAML()
-            self.yaml_loader.preserve_quotes = True
-            self.yaml_loader.width = 4096
+            if _RuamelYAML is None:
+                raise ImportError("ruamel.yaml è necessario per preservare i commenti: pip install ruamel.yaml")
+            self.yaml_loader = _get_ruamel()
         else:
             self.yaml_loader = yaml
     
-    def convert_automation(self, automation: Dict[str, Any]) -> Dict[str, Any]:
-        """Converte una singola automazione dalla vecchia alla nuova sintassi"""
-        converted = deepcopy(automation)
-        changes = []
-        alias = converted.get('alias', 'Unnamed automation')
+    def convert_automation(self, automation: Dict[str, Any],
+                           _keys: frozenset = None) -> Dict[str, Any]:
+        """Converte una singola automazione dalla vecchia alla nuova sintassi.
         
-        # Verifica se l'automazione è già in nuova sintassi
-        if self._is_new_syntax(automation):
-            self.changes_log.append(f"⚪ {alias}: già in nuova sintassi")
-            return converted
-        
-        # Conversione trigger -> triggers
-        if 'trigger' in converted:
-            converted['triggers'] = self._convert_triggers(converted['trigger'])
-            del converted['trigger']
-            changes.append("trigger → triggers")
-        
-        # Conversione condition -> conditions
-        if 'condition' in converted:
-            converted['conditions'] = converted['condition']
-            del converted['condition']
-            changes.append("condition → conditions")
+        _keys sono le chiavi di automazione già calcolate dal chiamante con
+        _automation_keys, per non ripetere la scansione del dizionario.
+        """
+        keys = _keys if _keys is not None else self._automation_keys(automation)
         
-        # Conversione action -> actions
-        if 'action' in converted:
-            converted['actions'] = converted['action']
-            del converted['action']
-            changes.append("action → actions")
+        if keys.isdisjoint(_OLD_KEYS):
+            # Percorso rapido: già in nuova sintassi, nessuna copia
+            if not keys.isdisjoint(_NEW_KEYS):
+                alias = automation.get('alias', 'Unnamed automation')
+                self.changes_log.append(('already_new', alias))
+                self._already_new_count += 1
+            # Altrimenti nessuna chiave da convertire: restituisce l'originale
+            return automation
         
-        if changes:
-            self.changes_log.append(f"✓ {alias}: {', '.join(changes)}")
+        # Rinomina in un solo passaggio: trigger/condition/action -> plurale
+        alias = automation.get('alias', 'Unnamed automation')
+        converted = automation.copy()
+        for old_key, new_key in _RENAMES:
+            if old_key not in keys:
+                continue
+            value = converted.pop(old_key)
+            if old_key == 'trigger':
+                # Un trigger singolo diventa comunque una lista
+                rename = self._rename_trigger
+                value = [rename(value)] if isinstance(value, dict) else [rename(t) for t in value]
+            converted[new_key] = value
         
+        # Voce strutturata: il testo viene composto solo quando serve
+        self.changes_log.append(('converted', alias, keys & _OLD_KEYS))
+        self._converted_count += 1
         return converted
     
-    def _convert_triggers(self, triggers: Union[Dict, List[Dict]]) -> List[Dict]:
-        """Converte i trigger dalla vecchia sintassi"""
-        if isinstance(triggers, dict):
-            triggers = [triggers]
-        
-        converted_triggers = []
-        for trigger in triggers:
-            converted_trigger = deepcopy(trigger)
-            
-            # Conversione platform -> trigger
-            if 'platform' in converted_trigger:
-                converted_trigger['trigger'] = converted_trigger['platform']
-                del converted_trigger['platform']
-            
-            converted_triggers.append(converted_trigger)
+    @staticmethod
+    def _rename_trigger(trigger: Any) -> Any:
+        """Converte un singolo trigger: platform -> trigger"""
+        if not isinstance(trigger, dict):
+            return trigger
         
-        return converted_triggers
+        # Copia superficiale: le sottostrutture restano condivise
+        converted_trigger = trigger.copy()
+        platform = converted_trigger.pop('platform', _MISSING)
+        if platform is not _MISSING:
+            converted_trigger['trigger'] = platform
+        return converted_trigger
     
     def convert_file(self, input_file: Path, output_file: Path = None) -> bool:
         """Converte un file YAML completo"""
         try:
-            # Lettura file
-            with open(input_file, 'r', encoding='utf-8') as f:
-                if self.preserve_comments:
-                    data = self.yaml_loader.load(f)
-                else:
-                    data = yaml.safe_load(f)
+            output_path = output_file or input_file.with_suffix('.new.yaml')
             
             # Reset log modifiche per questo file
-            self.changes_log = []
+            self._reset_changes()
             
-            # Conversione
-            converted_data = self._convert_yaml_data(data)
+            if self.preserve_comments:
+                # Lettura file
+                data = self.load_file(input_file)
+                
+                # Conversione
+                converted_data = self._convert_yaml_data(data)
+                
+                # Scrittura file output
+                # Serializza in memoria e scrive con un'unica write binaria
+                buffer = BytesIO()
+                self._dump_yaml(converted_data, buffer)
+                with open(output_path, 'wb') as f:
+                    f.write(buffer.getvalue())
+            else:
+                # Senza commenti: conversione in streaming, un'automazione alla volta.
+                # Vale anche sul file stesso: l'output lo sostituisce solo alla fine
+                self._convert_stream(input_file, output_path)
             
             # Aggiorna statistiche totali
             file_stats = self.get_summary_stats()
@@ -107,60 +176,143 @@ class HAYamlConverter:
             self.total_stats['already_new'] += file_stats['already_new']
             self.total_stats['total'] += file_stats['total']
             
-            # Scrittura file output
-            output_path = output_file or input_file.with_suffix('.new.yaml')
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if self.preserve_comments:
-                    self.yaml_loader.dump(converted_data, f)
-                else:
-                    yaml.dump(converted_data, f, default_flow_style=False, 
-                             allow_unicode=True, sort_keys=False)
-            
             return True
             
         except Exception as e:
             print(f"❌ Errore durante la conversione: {e}")
             return False
     
+    def _convert_stream(self, input_file: Path, output_path: Path) -> None:
+        """Converte un file senza caricarlo interamente in memoria.
+        
+        Se la radice è una lista, ogni elemento viene composto, convertito e
+        scritto singolarmente; altrimenti il documento è convertito per intero.
+        L'output va in un file temporaneo nella stessa directory che sostituisce
+        output_path solo a conversione riuscita.
+        """
+        # Come open(output_path, 'w'): si scrive attraverso eventuali symlink
+        target = output_path.resolve()
+        with open(input_file, 'r', encoding='utf-8') as src:
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.",
+                                            suffix='.tmp')
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, 'wb') as dst:
+                    loader = _StreamingLoader(src)
+                    try:
+                        self._stream_document(loader, dst)
+                    finally:
+                        loader.dispose()
+                
+                # mkstemp crea il file con permessi 0600: riporta quelli attesi
+                if target.exists():
+                    shutil.copymode(target, tmp_path)
+                else:
+                    os.chmod(tmp_path, _default_file_mode())
+                os.replace(tmp_path, target)
+            except BaseException:
+                # Anche su interruzione: niente file temporanei né modifiche
+                # registrate per automazioni non scritte
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                self._reset_changes()
+                raise
+    
+    def _stream_document(self, loader: '_StreamingLoader', dst) -> None:
+        """Consuma gli eventi del loader scrivendo su dst i dati convertiti"""
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            # File vuoto
+            self._dump_yaml(None, dst)
+            return
+        
+        loader.get_event()  # DocumentStartEvent
+        # Una lista radice con anchor può essere referenziata dai suoi elementi:
+        # in quel caso va composta per intero
+        if loader.check_event(yaml.SequenceStartEvent) and loader.peek_event().anchor is None:
+            # Lista di automazioni: un elemento alla volta
+            loader.get_event()
+            index = 0
+            while not loader.check_event(yaml.SequenceEndEvent):
+                item = loader.construct_document(loader.compose_node(None, index))
+                keys = self._automation_keys(item)
+                if keys:
+                    item = self.convert_automation(item, keys)
+                self._dump_yaml([item], dst)
+                index += 1
+            if not index:
+                self._dump_yaml([], dst)
+            loader.get_event()  # SequenceEndEvent
+        else:
+            data = loader.construct_document(loader.compose_node(None, None))
+            self._dump_yaml(self._convert_yaml_data(data), dst)
+        loader.get_event()  # DocumentEndEvent
+        
+        if not loader.check_event(yaml.StreamEndEvent):
+            raise ComposerError("expected a single document in the stream",
+                                None, "but found another document",
+                                loader.get_event().start_mark)
+    
+    def load_file(self, input_file: Path) -> Any:
+        """Carica un file YAML con il loader configurato"""
+        with open(input_file, 'r', encoding='utf-8') as f:
+            if self.preserve_comments:
+                return self.yaml_loader.load(f)
+            return yaml.load(f, Loader=SafeLoader)
+    
+    def _dump_yaml(self, data: Any, stream) -> None:
+        """Serializza i dati convertiti in UTF-8 sullo stream binario di output"""
+        if self.preserve_comments:
+            self.yaml_loader.dump(data, stream)
+        else:
+            yaml.dump(data, stream, Dumper=SafeDumper, default_flow_style=False, 
+                     allow_unicode=True, sort_keys=False, encoding='utf-8')
+    
     def _convert_yaml_data(self, data: Any) -> Any:
         """Converte i dati YAML in base alla struttura"""
         if isinstance(data, list):
             # Lista di automazioni
-            return [self.convert_automation(item) if self._is_automation(item) else item 
-                   for item in data]
-        elif isinstance(data, dict):
-            if self._is_automation(data):
-                # Singola automazione
-                return self.convert_automation(data)
-            else:
-                # Struttura più complessa (es. configuration.yaml)
-                converted = {}
-                for key, value in data.items():
-                    if key == 'automation':
-                        converted[key] = self._convert_yaml_data(value)
-                    else:
-                        converted[key] = value
-                return converted
+            return self._convert_automation_list(data)
+        if not isinstance(data, dict):
+            return data
+        keys = self._automation_keys(data)
+        if keys:
+            # Singola automazione
+            return self.convert_automation(data, keys)
         
-        return data
+        # Struttura più complessa (es. configuration.yaml): si scende solo lungo
+        # la chiave 'automation', iterando invece di ricorrere
+        root = parent = dict(data)
+        while 'automation' in parent:
+            value = parent['automation']
+            if isinstance(value, list):
+                parent['automation'] = self._convert_automation_list(value)
+            elif isinstance(value, dict):
+                keys = self._automation_keys(value)
+                if keys:
+                    parent['automation'] = self.convert_automation(value, keys)
+                else:
+                    parent['automation'] = parent = dict(value)
+                    continue
+            break
+        return root
     
-    def _is_automation(self, item: Dict) -> bool:
-        """Verifica se un dizionario è un'automazione HA"""
-        automation_keys = {'trigger', 'triggers', 'condition', 'conditions', 
-                          'action', 'actions', 'alias'}
-        return isinstance(item, dict) and any(key in item for key in automation_keys)
+    def _convert_automation_list(self, items: List[Any]) -> List[Any]:
+        """Converte gli elementi di una lista che sono automazioni"""
+        automation_keys = self._automation_keys
+        convert = self.convert_automation
+        converted = []
+        for item in items:
+            keys = automation_keys(item)
+            converted.append(convert(item, keys) if keys else item)
+        return converted
     
-    def _is_new_syntax(self, automation: Dict) -> bool:
-        """Verifica se un'automazione è già in nuova sintassi"""
-        if not isinstance(automation, dict):
-            return False
-        
-        # Se ha solo chiavi nuove, è già convertita
-        has_new_keys = any(key in automation for key in ['triggers', 'conditions', 'actions'])
-        has_old_keys = any(key in automation for key in ['trigger', 'condition', 'action'])
-        
-        return has_new_keys and not has_old_keys
+    @staticmethod
+    def _automation_keys(item: Any) -> frozenset:
+        """Restituisce le chiavi di automazione presenti (vuoto se non è un'automazione)"""
+        if not isinstance(item, dict):
+            return _NO_KEYS
+        return _AUTOMATION_KEYS.intersection(item)
     
     def convert_directory(self, input_dir: Path, pattern: str = "*.yaml") -> Dict[str, bool]:
         """Converte tutti i file YAML in una directory"""
@@ -171,79 +323,128 @@ class HAYamlConverter:
         self.total_stats = {'converted': 0, 'already_new': 0, 'total': 0}
         
         results = {}
-        yaml_files = list(input_dir.glob(pattern)) + list(input_dir.glob("*.yml"))
+        # Unica scansione della directory: file YAML che corrispondono al pattern
+        # (i .yml sono sempre inclusi), esclusi gli output .new.* già generati
+        yaml_files = []
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                suffix = os.path.splitext(name)[1].lower()
+                if (suffix in _NEW_SUFFIX and entry.is_file()
+                        and not name.lower().endswith(_NEW_SUFFIX[suffix])
+                        and (suffix == '.yml' or fnmatch.fnmatch(name, pattern))):
+                    # Genera nome file output con suffisso .new.yaml/.new.yml
+                    yaml_file = Path(entry.path)
+                    yaml_files.append((yaml_file, yaml_file.with_suffix(_NEW_SUFFIX[suffix])))
         
         if not yaml_files:
             print(f"⚠️  Nessun file YAML trovato in {input_dir}")
             return results
         
+        # Stessa directory: basta ordinare per nome, sul posto
+        yaml_files.sort(key=lambda item: item[0].name)
+        
         print(f"📁 Trovati {len(yaml_files)} file YAML in {input_dir}")
         print("="*60)
         
-        for yaml_file in sorted(yaml_files):
-            print(f"\n🔄 Processando {yaml_file.name}...")
+        # Ogni file è indipendente: conversione in parallelo su più processi
+        with ProcessPoolExecutor() as executor:
+            jobs = []
+            for yaml_file, output_file in yaml_files:
+                future = executor.submit(_convert_one, yaml_file, output_file,
+                                         self.preserve_comments)
+                jobs.append((yaml_file, output_file, future))
             
-            try:
-                # Genera nome file output con suffisso .new.yaml
-                if yaml_file.suffix.lower() == '.yml':
-                    output_file = yaml_file.with_suffix('.new.yml')
-                else:
-                    output_file = yaml_file.with_suffix('.new.yaml')
+            for yaml_file, output_file, future in jobs:
+                # Messaggi del file raccolti e scritti con un'unica write
+                lines = [f"\n🔄 Processando {yaml_file.name}..."]
                 
-                success = self.convert_file(yaml_file, output_file)
-                results[str(yaml_file)] = success
-                
-                if success:
-                    print(f"   ✅ Convertito in {output_file.name}")
-                    if self.changes_log:
-                        # Mostra le modifiche di questo specifico file
-                        for change in self.changes_log:
-                            print(f"   {change}")
-                    else:
-                        print("   ⚪ Nessuna modifica necessaria")
-                else:
-                    print(f"   ❌ Errore nella conversione")
+                try:
+                    success, changes_log, file_stats, worker_output = future.result()
+                    results[str(yaml_file)] = success
+                    if worker_output:
+                        lines.append(worker_output.rstrip('\n'))
                     
-            except Exception as e:
-                print(f"   ❌ Errore: {e}")
-                results[str(yaml_file)] = False
+                    if success:
+                        # Aggiorna statistiche totali
+                        for key in self.total_stats:
+                            self.total_stats[key] += file_stats[key]
+                        
+                        lines.append(f"   ✅ Convertito in {output_file.name}")
+                        if changes_log:
+                            # Mostra le modifiche di questo specifico file
+                            lines.extend(f"   {self.format_change(change)}" for change in changes_log)
+                        else:
+                            lines.append("   ⚪ Nessuna modifica necessaria")
+                    else:
+                        lines.append(f"   ❌ Errore nella conversione")
+                        
+                except Exception as e:
+                    lines.append(f"   ❌ Errore: {e}")
+                    results[str(yaml_file)] = False
+                
+                sys.stdout.write("\n".join(lines) + "\n")
         
         return results
+    
+    def convert_string(self, yaml_string: str) -> str:
         """Converte una stringa YAML"""
         try:
             if self.preserve_comments:
                 data = self.yaml_loader.load(yaml_string)
                 converted = self._convert_yaml_data(data)
                 
-                from io import StringIO
                 output = StringIO()
                 self.yaml_loader.dump(converted, output)
                 return output.getvalue()
             else:
-                data = yaml.safe_load(yaml_string)
+                data = yaml.load(yaml_string, Loader=SafeLoader)
                 converted = self._convert_yaml_data(data)
-                return yaml.dump(converted, default_flow_style=False, 
+                return yaml.dump(converted, Dumper=SafeDumper, default_flow_style=False, 
                                allow_unicode=True, sort_keys=False)
         
         except Exception as e:
             raise ValueError(f"Errore nella conversione stringa: {e}")
     
+    def convert_data_only(self, data: Any) -> Any:
+        """Converte dati YAML già caricati senza serializzarli (es. per dry-run)"""
+        self._reset_changes()
+        return self._convert_yaml_data(data)
+    
+    def _reset_changes(self) -> None:
+        """Azzera log e contatori delle modifiche"""
+        self.changes_log = []
+        self._converted_count = 0
+        self._already_new_count = 0
+    
+    @staticmethod
+    def format_change(entry: Tuple) -> str:
+        """Formatta una voce di changes_log come riga del report"""
+        if entry[0] == 'converted':
+            _, alias, old_keys = entry
+            changes = ', '.join(f"{old_key} → {new_key}" for old_key, new_key in _RENAMES
+                                if old_key in old_keys)
+            return f"✓ {alias}: {changes}"
+        return f"⚪ {entry[1]}: già in nuova sintassi"
+    
     def get_changes_report(self) -> str:
         """Restituisce un report delle modifiche effettuate"""
         if not self.changes_log:
             return "Nessuna modifica necessaria."
         
-        # Conta i diversi tipi di modifiche
-        converted = [log for log in self.changes_log if log.startswith("✓")]
-        already_new = [log for log in self.changes_log if log.startswith("⚪")]
+        # Separa i diversi tipi di modifiche in un solo passaggio
+        converted = []
+        already_new = []
+        for entry in self.changes_log:
+            (converted if entry[0] == 'converted' else already_new).append(self.format_change(entry))
         
         report = "📋 Report conversione:\n"
         if converted:
-            report += f"\n✅ Automazioni convertite ({len(converted)}):\n"
+            report += f"\n✅ Automazioni convertite ({self._converted_count}):\n"
             report += "\n".join(converted)
         
         if already_new:
-            report += f"\n\n⚪ Automazioni già aggiornate ({len(already_new)}):\n"
+            report += f"\n\n⚪ Automazioni già aggiornate ({self._already_new_count}):\n"
             report += "\n".join(already_new)
         
         report += f"\n\n📊 Totale processate: {len(self.changes_log)}"
@@ -251,19 +452,28 @@ class HAYamlConverter:
     
     def get_summary_stats(self) -> Dict[str, int]:
         """Restituisce statistiche riassuntive"""
-        converted = len([log for log in self.changes_log if log.startswith("✓")])
-        already_new = len([log for log in self.changes_log if log.startswith("⚪")])
-        
         return {
-            'converted': converted,
-            'already_new': already_new,
-            'total': len(self.changes_log)
+            'converted': self._converted_count,
+            'already_new': self._already_new_count,
+            'total': self._converted_count + self._already_new_count
         }
     
     def get_total_stats(self) -> Dict[str, int]:
         """Restituisce statistiche totali cumulative per conversioni di directory"""
         return self.total_stats.copy()
 
+def _convert_one(input_file: Path, output_file: Path,
+                 preserve_comments: bool) -> Tuple[bool, List[Tuple], Dict[str, int], str]:
+    """Converte un singolo file in un processo worker (usato da convert_directory).
+    
+    L'output del worker (es. messaggi di errore) viene catturato e restituito,
+    così il processo principale lo stampa in ordine senza sovrapposizioni.
+    """
+    converter = HAYamlConverter(preserve_comments=preserve_comments)
+    with redirect_stdout(StringIO()) as output:
+        success = converter.convert_file(input_file, output_file)
+    return success, converter.changes_log, converter.get_summary_stats(), output.getvalue()
+
 def main():
     """Funzione principale CLI"""
     parser = argparse.ArgumentParser(
@@ -301,13 +511,10 @@ Esempi d'uso:
     
     # Verifica dipendenze per preservazione commenti
     preserve_comments = not args.no_comments
-    if preserve_comments:
-        try:
-            import ruamel.yaml
-        except ImportError:
-            print("⚠️  ruamel.yaml non installato. Installare con: pip install ruamel.yaml")
-            print("   Procedo senza preservazione commenti...")
-            preserve_comments = False
+    if preserve_comments and _RuamelYAML is None:
+        print("⚠️  ruamel.yaml non installato. Installare con: pip install ruamel.yaml")
+        print("   Procedo senza preservazione commenti...")
+        preserve_comments = False
     
     # Inizializzazione convertitore
     converter = HAYamlConverter(preserve_comments=preserve_comments)
@@ -383,10 +590,9 @@ Esempi d'uso:
     if args.dry_run:
         print("🔍 Modalità DRY-RUN - nessun file verrà modificato")
         try:
-            with open(args.input_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            converted = converter.convert_string(content)
+            # Solo caricamento e conversione: l'output non viene serializzato
+            data = converter.load_file(args.input_file)
+            converter.convert_data_only(data)
             print("\n📋 Anteprima modifiche:")
             print(converter.get_changes_report())
             